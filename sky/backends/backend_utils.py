@@ -1,4 +1,5 @@
 """Util constants/functions for the backends."""
+from concurrent import futures
 from datetime import datetime
 import enum
 import fnmatch
@@ -12,6 +13,7 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
 import typing
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
@@ -67,6 +69,7 @@ logger = sky_logging.init_logger(__name__)
 SKY_REMOTE_APP_DIR = '~/.sky/sky_app'
 # Exclude subnet mask from IP address regex.
 IP_ADDR_REGEX = r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(?!/\d{1,2})\b'
+IP_ADDR_PATTERN = re.compile(IP_ADDR_REGEX, re.ASCII)
 SKY_REMOTE_PATH = '~/.sky/wheels'
 SKY_USER_FILE_PATH = '~/.sky/generated'
 
@@ -88,6 +91,16 @@ _LAUNCHING_IP_PATTERN = re.compile(
     r'({}): ray[._]worker[._](?:default|reserved)'.format(IP_ADDR_REGEX))
 WAIT_HEAD_NODE_IP_MAX_ATTEMPTS = 3
 
+# Characters to strip from the owner identity stored in the cluster record,
+# caused by the cloud CLI output, e.g. gcloud. Removed in a single pass.
+_OWNER_IDENTITY_CLEANUP_TABLE = str.maketrans('', '', '\n\\')
+
+# The libyaml-based dumper, when PyYAML is built with it, for YAML files that
+# are only read by programs, e.g., the temporary cluster YAML for `ray`
+# commands. User-facing YAMLs go through common_utils.dump_yaml instead, whose
+# formatting needs the pure-Python dumper.
+_YAML_SAFE_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 # We check network connection by going through _TEST_IP_LIST. We may need to
 # check multiple IPs because some IPs may be blocked on certain networks.
 # Fixed IP addresses are used to avoid DNS lookup blocking the check, for
@@ -165,7 +178,7 @@ _RAY_YAML_KEYS_TO_RESTORE_EXCEPTIONS = [
 
 def is_ip(s: str) -> bool:
     """Returns whether this string matches IP_ADDR_REGEX."""
-    return len(re.findall(IP_ADDR_REGEX, s)) == 1
+    return len(IP_ADDR_PATTERN.findall(s)) == 1
 
 
 def _get_yaml_path_from_cluster_name(cluster_name: str,
@@ -264,11 +277,13 @@ def _optimize_file_mounts(yaml_path: str) -> None:
         # cp <local_src> <local_runtime_files_dir>/<unique name of local_src>.
         full_local_src = str(pathlib.Path(local_src).expanduser())
         unique_name = local_source_to_unique_name[local_src]
-        # !r to add quotes for paths containing spaces.
-        subprocess.run(
-            f'cp -r {full_local_src!r} {local_runtime_files_dir}/{unique_name}',
-            shell=True,
-            check=True)
+        # Pass the args as a list to avoid spawning a shell per file, which
+        # also handles paths containing spaces or quotes.
+        cp_command = [
+            'cp', '-r', full_local_src,
+            os.path.join(local_runtime_files_dir, unique_name)
+        ]
+        subprocess.run(cp_command, check=True)
 
     common_utils.dump_yaml(yaml_path, yaml_config)
 
@@ -394,6 +409,43 @@ class FileMountHelper(object):
         ]
         return ' && '.join(commands)
 
+    @classmethod
+    def paths_overlap(cls, path: str, other: str) -> bool:
+        """Returns whether one path is equal to or nested under the other.
+
+        File mounts with overlapping destinations write to the same files, so
+        they must be synced one after another, in the order they are given.
+        """
+        path = os.path.normpath(path)
+        other = os.path.normpath(other)
+        return (path == other or path.startswith(os.path.join(other, '')) or
+                other.startswith(os.path.join(path, '')))
+
+    @classmethod
+    def make_cloud_store_download_command(
+            cls, *, install_commands: List[str],
+            download_commands: List[str]) -> str:
+        """Returns a command that downloads file mounts from cloud stores.
+
+        The (deduplicated) CLI install commands run once, one after another,
+        as they are not safe to run concurrently, e.g., they download to and
+        extract in fixed paths. With multiple downloads, the downloads then run
+        as background jobs, so the total time is bound by the slowest one
+        instead of the sum of all of them. Each job is waited on individually,
+        so that any failed download fails the command.
+        """
+        assert download_commands, download_commands
+        commands = list(dict.fromkeys(install_commands))
+        if len(download_commands) == 1:
+            commands.append(download_commands[0])
+        else:
+            jobs = ' '.join(
+                f'( {cmd} ) & pids+=($!);' for cmd in download_commands)
+            commands.append(f'{{ pids=(); rc=0; {jobs} '
+                            'for pid in "${pids[@]}"; do '
+                            'wait "$pid" || rc=$?; done; [ "$rc" -eq 0 ]; }')
+        return ' && '.join(commands)
+
 
 class SSHConfigHelper(object):
     """Helper for handling local SSH configuration."""
@@ -718,8 +770,8 @@ def _replace_yaml_dicts(
                 if key in old_block:
                     _restore_block(value, old_block[key])
 
-    new_config = yaml.safe_load(new_yaml)
-    old_config = yaml.safe_load(old_yaml)
+    new_config = common_utils.read_yaml_str(new_yaml)
+    old_config = common_utils.read_yaml_str(old_yaml)
     excluded_results = {}
     # Find all key values excluded from restore
     for exclude_restore_key_name_list in restore_key_names_exceptions:
@@ -976,7 +1028,7 @@ def write_cluster_config(
         # If dryrun, return the unfinished tmp yaml path.
         config_dict['ray'] = tmp_yaml_path
         return config_dict
-    _add_auth_to_cluster_config(cloud, tmp_yaml_path)
+    yaml_config = _add_auth_to_cluster_config(cloud, tmp_yaml_path)
 
     # Restore the old yaml content for backward compatibility.
     if os.path.exists(yaml_path) and keep_launch_fields_in_existing_config:
@@ -988,13 +1040,16 @@ def write_cluster_config(
             new_yaml_content, old_yaml_content,
             _RAY_YAML_KEYS_TO_RESTORE_FOR_BACK_COMPATIBILITY,
             _RAY_YAML_KEYS_TO_RESTORE_EXCEPTIONS)
-        with open(tmp_yaml_path, 'w', encoding='utf-8') as f:
-            f.write(restored_yaml_content)
-
-    # Read the cluster name from the tmp yaml file, to take the backward
-    # compatbility restortion above into account.
+        # Skip rewriting the file if nothing is restored, which is the common
+        # case when re-launching an existing cluster with the same version.
+        if restored_yaml_content != new_yaml_content:
+            with open(tmp_yaml_path, 'w', encoding='utf-8') as f:
+                f.write(restored_yaml_content)
+            yaml_config = common_utils.read_yaml_str(restored_yaml_content)
+
+    # Get the cluster name from the (possibly restored) tmp yaml config, to
+    # take the backward compatbility restortion above into account.
     # TODO: remove this after 2 minor releases, 0.8.0.
-    yaml_config = common_utils.read_yaml(tmp_yaml_path)
     config_dict['cluster_name_on_cloud'] = yaml_config['cluster_name']
 
     # Optimization: copy the contents of source files in file_mounts to a
@@ -1013,10 +1068,15 @@ def write_cluster_config(
     return config_dict
 
 
-def _add_auth_to_cluster_config(cloud: clouds.Cloud, cluster_config_file: str):
+def _add_auth_to_cluster_config(cloud: clouds.Cloud,
+                                cluster_config_file: str) -> Dict[str, Any]:
     """Adds SSH key info to the cluster config.
 
     This function's output removes comments included in the jinja2 template.
+
+    Returns:
+        The updated cluster config, i.e., the content written to
+        cluster_config_file, so that callers do not need to re-read it.
     """
     config = common_utils.read_yaml(cluster_config_file)
     # Check the availability of the cloud type.
@@ -1045,6 +1105,7 @@ def _add_auth_to_cluster_config(cloud: clouds.Cloud, cluster_config_file: str):
     else:
         assert False, cloud
     common_utils.dump_yaml(cluster_config_file, config)
+    return config
 
 
 def get_run_timestamp() -> str:
@@ -1159,6 +1220,11 @@ def wait_until_ray_cluster_ready(
     start = time.time()
     runner = command_runner.SSHCommandRunner(node=(head_ip, 22),
                                              **ssh_credentials)
+    # Poll with exponential backoff, so that we do not wait for up to 10
+    # seconds after the workers become ready, when they are ready soon after
+    # the head. Each sleep is capped at the previous fixed interval of 10
+    # seconds, as the backoff adds jitter on top of its own cap.
+    backoff = common_utils.Backoff(initial_backoff=1, max_backoff_factor=10)
     with rich_utils.safe_status(
             '[bold cyan]Waiting for workers...') as worker_status:
         while True:
@@ -1223,7 +1289,7 @@ def wait_until_ray_cluster_ready(
                     'Failed to launch multiple nodes on '
                     'GCP due to a nondeterministic bug in ray autoscaler.')
                 return False, None  # failed
-            time.sleep(10)
+            time.sleep(min(backoff.current_backoff(), 10))
     return True, docker_user  # success
 
 
@@ -1383,7 +1449,7 @@ def _query_head_ip_with_retries(cluster_yaml: str,
                 f'ray get-head-ip {full_cluster_yaml!r}',
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL).stdout.decode().strip()
-            head_ip_list = re.findall(IP_ADDR_REGEX, out)
+            head_ip_list = IP_ADDR_PATTERN.findall(out)
             if len(head_ip_list) > 1:
                 # This could be triggered if e.g., some logging is added in
                 # skypilot_config, a module that has some code executed
@@ -1410,6 +1476,62 @@ def _query_head_ip_with_retries(cluster_yaml: str,
     return head_ip
 
 
+def _query_worker_ips_with_retries(cluster_yaml: str, max_attempts: int,
+                                   stop_event: threading.Event) -> str:
+    """Returns the output of `ray get-worker-ips`.
+
+    Raises:
+      exceptions.FetchClusterInfoError: if we failed to get the worker IPs, or
+        stop_event is set before we succeed.
+    """
+    backoff = common_utils.Backoff(initial_backoff=5, max_backoff_factor=5)
+    for retry_cnt in range(max_attempts):
+        try:
+            full_cluster_yaml = str(pathlib.Path(cluster_yaml).expanduser())
+            proc = subprocess_utils.run(
+                f'ray get-worker-ips {full_cluster_yaml!r}',
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE)
+            return proc.stdout.decode()
+        except subprocess.CalledProcessError as e:
+            if retry_cnt == max_attempts - 1 or stop_event.is_set():
+                raise exceptions.FetchClusterInfoError(
+                    exceptions.FetchClusterInfoError.Reason.WORKER) from e
+            # Retry if the ssh is not ready for the workers yet.
+            backoff_time = backoff.current_backoff()
+            logger.debug('Retrying to get worker ip '
+                         f'[{retry_cnt}/{max_attempts}] in '
+                         f'{backoff_time} seconds.')
+            # Wake up early if the caller no longer needs the worker IPs.
+            stop_event.wait(backoff_time)
+    raise exceptions.FetchClusterInfoError(
+        exceptions.FetchClusterInfoError.Reason.WORKER)
+
+
+def _query_worker_ips_in_background(
+        cluster_yaml: str, max_attempts: int,
+        stop_event: threading.Event) -> 'futures.Future[str]':
+    """Runs _query_worker_ips_with_retries() in a daemon thread.
+
+    A daemon thread is used instead of an executor, so that neither the caller
+    nor the interpreter exit waits for an in-flight `ray get-worker-ips` when
+    the worker IPs are no longer needed, e.g., the head IP query failed or the
+    user pressed Ctrl-C.
+    """
+    future: 'futures.Future[str]' = futures.Future()
+
+    def _run() -> None:
+        try:
+            future.set_result(
+                _query_worker_ips_with_retries(cluster_yaml, max_attempts,
+                                               stop_event))
+        except BaseException as e:  # pylint: disable=broad-except
+            future.set_exception(e)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
 @timeline.event
 def get_node_ips(cluster_yaml: str,
                  expected_num_nodes: int,
@@ -1460,39 +1582,34 @@ def get_node_ips(cluster_yaml: str,
     if get_internal_ips:
         with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
             ray_config['provider']['use_internal_ips'] = True
-            yaml.dump(ray_config, f)
+            yaml.dump(ray_config, f, Dumper=_YAML_SAFE_DUMPER)
             cluster_yaml = f.name
 
     # Check the network connection first to avoid long hanging time for
     # ray get-head-ip below, if a long-lasting network connection failure
     # happens.
     check_network_connection()
-    head_ip = _query_head_ip_with_retries(cluster_yaml,
-                                          max_attempts=head_ip_max_attempts)
-    head_ip_list = [head_ip]
+    worker_ips_future = None
+    stop_worker_query = threading.Event()
     if expected_num_nodes > 1:
-        backoff = common_utils.Backoff(initial_backoff=5, max_backoff_factor=5)
-
-        for retry_cnt in range(worker_ip_max_attempts):
-            try:
-                full_cluster_yaml = str(pathlib.Path(cluster_yaml).expanduser())
-                proc = subprocess_utils.run(
-                    f'ray get-worker-ips {full_cluster_yaml!r}',
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE)
-                out = proc.stdout.decode()
-                break
-            except subprocess.CalledProcessError as e:
-                if retry_cnt == worker_ip_max_attempts - 1:
-                    raise exceptions.FetchClusterInfoError(
-                        exceptions.FetchClusterInfoError.Reason.WORKER) from e
-                # Retry if the ssh is not ready for the workers yet.
-                backoff_time = backoff.current_backoff()
-                logger.debug('Retrying to get worker ip '
-                             f'[{retry_cnt}/{worker_ip_max_attempts}] in '
-                             f'{backoff_time} seconds.')
-                time.sleep(backoff_time)
-        worker_ips = re.findall(IP_ADDR_REGEX, out)
+        # `ray get-head-ip` and `ray get-worker-ips` are independent, and each
+        # pays for starting the `ray` CLI and querying the cloud. Query the
+        # worker IPs in the background while querying the head IP, to overlap
+        # the two.
+        worker_ips_future = _query_worker_ips_in_background(
+            cluster_yaml, worker_ip_max_attempts, stop_worker_query)
+    try:
+        head_ip = _query_head_ip_with_retries(cluster_yaml,
+                                              max_attempts=head_ip_max_attempts)
+    except BaseException:
+        # Stop retrying the worker IPs, as the head IP failure (or Ctrl-C) is
+        # raised anyway. The in-flight worker query is not waited for.
+        stop_worker_query.set()
+        raise
+    head_ip_list = [head_ip]
+    if worker_ips_future is not None:
+        out = worker_ips_future.result()
+        worker_ips = IP_ADDR_PATTERN.findall(out)
         if len(worker_ips) != expected_num_nodes - 1:
             n = expected_num_nodes - 1
             if len(worker_ips) > n:
@@ -1577,7 +1694,7 @@ def check_owner_identity(cluster_name: str) -> None:
                                           current_user_identity)):
             # Clean up the owner identity for the backslash and newlines, caused
             # by the cloud CLI output, e.g. gcloud.
-            owner = owner.replace('\n', '').replace('\\', '')
+            owner = owner.translate(_OWNER_IDENTITY_CLEANUP_TABLE)
             if owner == current:
                 if i != 0:
                     logger.warning(
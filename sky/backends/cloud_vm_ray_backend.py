@@ -19,7 +19,7 @@ import threading
 import time
 import typing
 from typing import (Any, Callable, Dict, Iterable, List, Optional, Set, Tuple,
-                    Union)
+                    Type, Union)
 
 import colorama
 import filelock
@@ -164,6 +164,12 @@ def _is_command_length_over_limit(command: str) -> bool:
 
 
 def _get_cluster_config_template(cloud):
+    return _get_cluster_config_template_for_cloud_type(type(cloud))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cluster_config_template_for_cloud_type(
+        cloud_type: Type[clouds.Cloud]) -> str:
     cloud_to_template = {
         clouds.AWS: 'aws-ray.yml.j2',
         clouds.Azure: 'azure-ray.yml.j2',
@@ -179,7 +185,7 @@ def _get_cluster_config_template(cloud):
         clouds.Vsphere: 'vsphere-ray.yml.j2',
         clouds.Fluidstack: 'fluidstack-ray.yml.j2'
     }
-    return cloud_to_template[type(cloud)]
+    return cloud_to_template[cloud_type]
 
 
 def write_ray_up_script_with_patched_launch_hash_fn(
@@ -256,6 +262,7 @@ class RayCodeGen:
         ray_address = 'auto'
         self._code = [
             textwrap.dedent(f"""\
+            import contextlib
             import getpass
             import hashlib
             import io
@@ -1788,8 +1795,8 @@ class RetryingVmProvisioner(object):
             # Last line looks like: 'ssh ... <user>@<public head_ip>\n'
             position = stdout.rfind('@')
             # Use a regex to extract the IP address.
-            external_ip_list = re.findall(backend_utils.IP_ADDR_REGEX,
-                                          stdout[position + 1:])
+            external_ip_list = backend_utils.IP_ADDR_PATTERN.findall(
+                stdout[position + 1:])
             head_internal_ip, head_external_ip = None, None
             if len(external_ip_list) == 1:
                 head_external_ip = external_ip_list[0]
@@ -1798,8 +1805,8 @@ class RetryingVmProvisioner(object):
             # The line looks like: 'Local node IP: <internal head_ip>\n'
             position = stdout.rfind('Local node IP')
             line = stdout[position:].partition('\n')[0]
-            internal_ip_list = re.findall(backend_utils.IP_ADDR_REGEX,
-                                          common_utils.remove_color(line))
+            internal_ip_list = backend_utils.IP_ADDR_PATTERN.findall(
+                common_utils.remove_color(line))
             if len(internal_ip_list) == 1:
                 head_internal_ip = internal_ip_list[0]
 
@@ -3088,6 +3095,12 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # Need this `-i` option to make sure `source ~/.bashrc` work
         setup_cmd = f'/bin/bash -i {remote_setup_file_name} 2>&1'
         runners = handle.get_command_runners(avoid_ssh_control=True)
+        # Uploading the setup script does not start any user process, so it
+        # can safely reuse the shared ssh connection (ControlMaster), which
+        # also warms it up for the job submission that follows. This saves a
+        # full ssh handshake per node for long setup scripts and for
+        # --detach-setup, where the setup is fused into the job itself.
+        script_upload_runners = handle.get_command_runners()
 
         def _setup_node(node_id: int) -> None:
             setup_envs = task.envs.copy()
@@ -3103,10 +3116,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     f.write(setup_script)
                     f.flush()
                     setup_sh_path = f.name
-                    runner.rsync(source=setup_sh_path,
-                                 target=remote_setup_file_name,
-                                 up=True,
-                                 stream_logs=False)
+                    script_upload_runners[node_id].rsync(
+                        source=setup_sh_path,
+                        target=remote_setup_file_name,
+                        up=True,
+                        stream_logs=False)
                 create_script_code = 'true'
             else:
                 create_script_code = (f'{{ echo {encoded_script} > '
@@ -4382,6 +4396,42 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         logger.info('To view detailed progress: '
                     f'{style.BRIGHT}{tail_cmd}{style.RESET_ALL}')
 
+        # Downloads from cloud stores are network-bound and independent of
+        # each other, so they are collected here and run concurrently. The
+        # pending batch is flushed before any mount whose destination overlaps
+        # it, so that overlapping mounts are still applied in dict order.
+        cloud_store_sources: List[str] = []
+        cloud_store_targets: List[str] = []
+        cloud_store_wrapped_targets: List[str] = []
+        cloud_store_installs: List[str] = []
+        cloud_store_downloads: List[str] = []
+
+        def _flush_cloud_store_downloads() -> None:
+            if not cloud_store_downloads:
+                return
+            command = (
+                backend_utils.FileMountHelper.make_cloud_store_download_command(
+                    install_commands=cloud_store_installs,
+                    download_commands=cloud_store_downloads))
+            # Sources and targets are only used for message printing.
+            backend_utils.parallel_data_transfer_to_nodes(
+                runners,
+                source=', '.join(cloud_store_sources),
+                target=', '.join(cloud_store_targets),
+                cmd=command,
+                run_rsync=False,
+                action_message='Syncing',
+                log_path=log_path,
+                stream_logs=False,
+                # Need to source bashrc, as the cloud specific CLI or SDK may
+                # require PATH in bashrc.
+                source_bashrc=True,
+            )
+            for pending in (cloud_store_sources, cloud_store_targets,
+                            cloud_store_wrapped_targets, cloud_store_installs,
+                            cloud_store_downloads):
+                pending.clear()
+
         for dst, src in file_mounts.items():
             # TODO: room for improvement.  Here there are many moving parts
             # (download gsutil on remote, run gsutil on remote).  Consider
@@ -4399,6 +4449,12 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     source=dst, target=wrapped_dst)
                 symlink_commands.append(cmd)
 
+            if any(
+                    backend_utils.FileMountHelper.paths_overlap(
+                        wrapped_dst, pending_dst)
+                    for pending_dst in cloud_store_wrapped_targets):
+                _flush_cloud_store_downloads()
+
             if not data_utils.is_cloud_store_url(src):
                 full_src = os.path.abspath(os.path.expanduser(src))
 
@@ -4423,13 +4479,13 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
 
             storage = cloud_stores.get_storage_from_path(src)
             if storage.is_directory(src):
-                sync_cmd = (storage.make_sync_dir_command(
-                    source=src, destination=wrapped_dst))
+                sync_cmd = storage.make_sync_dir_command(
+                    source=src, destination=wrapped_dst)
                 # It is a directory so make sure it exists.
                 mkdir_for_wrapped_dst = f'mkdir -p {wrapped_dst}'
             else:
-                sync_cmd = (storage.make_sync_file_command(
-                    source=src, destination=wrapped_dst))
+                sync_cmd = storage.make_sync_file_command(
+                    source=src, destination=wrapped_dst)
                 # It is a file so make sure *its parent dir* exists.
                 mkdir_for_wrapped_dst = (
                     f'mkdir -p {os.path.dirname(wrapped_dst)}')
@@ -4440,21 +4496,14 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 # Both the wrapped and the symlink dir exist; sync.
                 sync_cmd,
             ]
-            command = ' && '.join(download_target_commands)
-            # dst is only used for message printing.
-            backend_utils.parallel_data_transfer_to_nodes(
-                runners,
-                source=src,
-                target=dst,
-                cmd=command,
-                run_rsync=False,
-                action_message='Syncing',
-                log_path=log_path,
-                stream_logs=False,
-                # Need to source bashrc, as the cloud specific CLI or SDK may
-                # require PATH in bashrc.
-                source_bashrc=True,
-            )
+            cloud_store_sources.append(src)
+            cloud_store_targets.append(dst)
+            cloud_store_wrapped_targets.append(wrapped_dst)
+            cloud_store_installs.append(storage.make_install_command())
+            cloud_store_downloads.append(' && '.join(download_target_commands))
+
+        _flush_cloud_store_downloads()
+
         # (2) Run the commands to create symlinks on all the nodes.
         symlink_command = ' && '.join(symlink_commands)
         if symlink_command:
@@ -38,12 +38,25 @@ class CloudStorage:
         """
         raise NotImplementedError
 
+    def make_install_command(self) -> str:
+        """Makes a runnable bash command to install the CLI used for syncing.
+
+        The command is a no-op if the CLI is already installed.
+        """
+        raise NotImplementedError
+
     def make_sync_dir_command(self, source: str, destination: str) -> str:
-        """Makes a runnable bash command to sync a 'directory'."""
+        """Makes a runnable bash command to sync a 'directory'.
+
+        The command from make_install_command() must be run before it.
+        """
         raise NotImplementedError
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
-        """Makes a runnable bash command to sync a file."""
+        """Makes a runnable bash command to sync a file.
+
+        The command from make_install_command() must be run before it.
+        """
         raise NotImplementedError
 
 
@@ -77,6 +90,9 @@ class S3CloudStorage(CloudStorage):
         # A directory with few or no items
         return True
 
+    def make_install_command(self) -> str:
+        return ' && '.join(self._GET_AWSCLI)
+
     def make_sync_dir_command(self, source: str, destination: str) -> str:
         """Downloads using AWS CLI."""
         # AWS Sync by default uses 10 threads to upload files to the bucket.
@@ -85,17 +101,13 @@ class S3CloudStorage(CloudStorage):
         download_via_awscli = ('aws s3 sync --no-follow-symlinks '
                                f'{source} {destination}')
 
-        all_commands = list(self._GET_AWSCLI)
-        all_commands.append(download_via_awscli)
-        return ' && '.join(all_commands)
+        return download_via_awscli
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
         """Downloads a file using AWS CLI."""
         download_via_awscli = f'aws s3 cp {source} {destination}'
 
-        all_commands = list(self._GET_AWSCLI)
-        all_commands.append(download_via_awscli)
-        return ' && '.join(all_commands)
+        return download_via_awscli
 
 
 class GcsCloudStorage(CloudStorage):
@@ -145,21 +157,20 @@ class GcsCloudStorage(CloudStorage):
         assert out == url, (out, url)
         return True
 
+    def make_install_command(self) -> str:
+        return self._INSTALL_GSUTIL
+
     def make_sync_dir_command(self, source: str, destination: str) -> str:
         """Downloads a directory using gsutil."""
         download_via_gsutil = (f'{self._gsutil_command} '
                                f'rsync -e -r {source} {destination}')
-        all_commands = [self._INSTALL_GSUTIL]
-        all_commands.append(download_via_gsutil)
-        return ' && '.join(all_commands)
+        return download_via_gsutil
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
         """Downloads a file using gsutil."""
         download_via_gsutil = f'{self._gsutil_command} ' \
                               f'cp {source} {destination}'
-        all_commands = [self._INSTALL_GSUTIL]
-        all_commands.append(download_via_gsutil)
-        return ' && '.join(all_commands)
+        return download_via_gsutil
 
 
 class AzureBlobCloudStorage(CloudStorage):
@@ -317,6 +328,9 @@ class AzureBlobCloudStorage(CloudStorage):
 
         return shlex.quote(converted_source)
 
+    def make_install_command(self) -> str:
+        return ' && '.join(self._GET_AZCOPY)
+
     def make_sync_dir_command(self, source: str, destination: str) -> str:
         """Fetches a directory using AZCOPY from storage to remote instance."""
         source = self._get_azcopy_source(source, is_dir=True)
@@ -326,17 +340,13 @@ class AzureBlobCloudStorage(CloudStorage):
         destination = f'{destination}/'
         download_command = (f'azcopy sync {source} {destination} '
                             '--recursive --delete-destination=false')
-        all_commands = list(self._GET_AZCOPY)
-        all_commands.append(download_command)
-        return ' && '.join(all_commands)
+        return download_command
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
         """Fetches a file using AZCOPY from storage to remote instance."""
         source = self._get_azcopy_source(source, is_dir=False)
         download_command = f'azcopy copy {source} {destination}'
-        all_commands = list(self._GET_AZCOPY)
-        all_commands.append(download_command)
-        return ' && '.join(all_commands)
+        return download_command
 
 
 class R2CloudStorage(CloudStorage):
@@ -369,6 +379,9 @@ class R2CloudStorage(CloudStorage):
         # A directory with few or no items
         return True
 
+    def make_install_command(self) -> str:
+        return ' && '.join(self._GET_AWSCLI)
+
     def make_sync_dir_command(self, source: str, destination: str) -> str:
         """Downloads using AWS CLI."""
         # AWS Sync by default uses 10 threads to upload files to the bucket.
@@ -384,9 +397,7 @@ class R2CloudStorage(CloudStorage):
                                f'--endpoint {endpoint_url} '
                                f'--profile={cloudflare.R2_PROFILE_NAME}')
 
-        all_commands = list(self._GET_AWSCLI)
-        all_commands.append(download_via_awscli)
-        return ' && '.join(all_commands)
+        return download_via_awscli
 
     def make_sync_file_command(self, source: str, destination: str) -> str:
         """Downloads a file using AWS CLI."""
@@ -399,9 +410,7 @@ class R2CloudStorage(CloudStorage):
                                f'--endpoint {endpoint_url} '
                                f'--profile={cloudflare.R2_PROFILE_NAME}')
 
-        all_commands = list(self._GET_AWSCLI)
-        all_commands.append(download_via_awscli)
-        return ' && '.join(all_commands)
+        return download_via_awscli
 
 
 class IBMCosCloudStorage(CloudStorage):
@@ -435,6 +444,9 @@ class IBMCosCloudStorage(CloudStorage):
         # A directory with few or no items
         return True
 
+    def make_install_command(self) -> str:
+        return ' && '.join(self._GET_RCLONE)
+
     def _get_rclone_sync_command(self, source: str, destination: str):
         bucket_name, data_path, bucket_region = data_utils.split_cos_path(
             source)
@@ -452,9 +464,7 @@ class IBMCosCloudStorage(CloudStorage):
             'rclone copy '
             f'{bucket_rclone_profile}:{data_path_in_bucket} {destination}')
 
-        all_commands = list(self._GET_RCLONE)
-        all_commands.append(configure_rclone)
-        all_commands.append(download_via_rclone)
+        all_commands = [configure_rclone, download_via_rclone]
         return ' && '.join(all_commands)
 
     def make_sync_dir_command(self, source: str, destination: str) -> str:
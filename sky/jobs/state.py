@@ -206,8 +206,7 @@ class ManagedJobStatus(enum.Enum):
         return self in self.failure_statuses()
 
     def colored_str(self) -> str:
-        color = _SPOT_STATUS_TO_COLOR[self]
-        return f'{color}{self.value}{colorama.Style.RESET_ALL}'
+        return _SPOT_STATUS_TO_COLORED_STR[self]
 
     def __lt__(self, other) -> bool:
         status_list = list(ManagedJobStatus)
@@ -249,6 +248,10 @@ _SPOT_STATUS_TO_COLOR = {
     ManagedJobStatus.CANCELLING: colorama.Fore.YELLOW,
     ManagedJobStatus.CANCELLED: colorama.Fore.YELLOW,
 }
+_SPOT_STATUS_TO_COLORED_STR = {
+    status: f'{color}{status.value}{colorama.Style.RESET_ALL}'
+    for status, color in _SPOT_STATUS_TO_COLOR.items()
+}
 
 
 # === Status transition functions ===
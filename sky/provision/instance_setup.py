@@ -5,6 +5,7 @@ import hashlib
 import json
 import os
 import resource
+import shlex
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -39,12 +40,26 @@ _DUMP_RAY_PORTS = (
     f'open(os.path.expanduser("{constants.SKY_REMOTE_RAY_PORT_FILE}"), "w", '
     'encoding="utf-8"))\';')
 
+
+def _echo_ray_port_payload_command() -> str:
+    """Returns a command that prints $RAY_PORT as an encoded payload.
+
+    The payload is printed by the shell instead of another Python process, as
+    the command is run for every ray status check, and each remote Python
+    interpreter startup (with the sky imports) adds noticeable latency.
+    """
+    placeholder = 'SKY_RAY_PORT_PLACEHOLDER'
+    prefix, suffix = common_utils.encode_payload({
+        'ray_port': placeholder
+    }).split(f'"{placeholder}"')
+    return f'echo {shlex.quote(prefix)}"$RAY_PORT"{shlex.quote(suffix)}'
+
+
 _RAY_PORT_COMMAND = (
     f'RAY_PORT=$({constants.SKY_PYTHON_CMD} -c '
     '"from sky.skylet import job_lib; print(job_lib.get_ray_port())" '
     '2> /dev/null || echo 6379);'
-    f'{constants.SKY_PYTHON_CMD} -c "from sky.utils import common_utils; '
-    'print(common_utils.encode_payload({\'ray_port\': $RAY_PORT}))"')
+    f'{_echo_ray_port_payload_command()}')
 
 # Command that calls `ray status` with SkyPilot's Ray port set.
 RAY_STATUS_WITH_SKY_RAY_PORT_COMMAND = (
@@ -116,10 +131,12 @@ def _parallel_ssh_with_cache(func,
         # Not using the default value of `max_workers` in ThreadPoolExecutor,
         # as 32 is too large for some machines.
         max_workers = subprocess_utils.get_parallel_threads()
+    runners = provision.get_command_runners(cluster_info.provider_name,
+                                            cluster_info, **ssh_credentials)
+    # Do not start more threads than the number of nodes.
+    max_workers = max(1, min(max_workers, len(runners)))
     with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
         results = []
-        runners = provision.get_command_runners(cluster_info.provider_name,
-                                                cluster_info, **ssh_credentials)
         # instance_ids is guaranteed to be in the same order as runners.
         instance_ids = cluster_info.instance_ids()
         for i, runner in enumerate(runners):
@@ -1,17 +1,15 @@
 """Kubernetes network provisioning utils."""
-import os
 import time
 from typing import Dict, List, Optional, Tuple, Union
 
-import jinja2
 import yaml
 
-import sky
 from sky import exceptions
 from sky import sky_logging
 from sky import skypilot_config
 from sky.adaptors import kubernetes
 from sky.provision.kubernetes import utils as kubernetes_utils
+from sky.utils import common_utils
 from sky.utils import kubernetes_enums
 from sky.utils import ux_utils
 
@@ -67,22 +65,14 @@ def get_networking_mode(
 def fill_loadbalancer_template(namespace: str, service_name: str,
                                ports: List[int], selector_key: str,
                                selector_value: str) -> Dict:
-    template_path = os.path.join(sky.__root_dir__, 'templates',
-                                 _LOADBALANCER_TEMPLATE_NAME)
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(
-            f'Template "{_LOADBALANCER_TEMPLATE_NAME}" does not exist.')
-
-    with open(template_path, 'r', encoding='utf-8') as fin:
-        template = fin.read()
-    j2_template = jinja2.Template(template)
-    cont = j2_template.render(
-        namespace=namespace,
-        service_name=service_name,
-        ports=ports,
-        selector_key=selector_key,
-        selector_value=selector_value,
-    )
+    cont = common_utils.render_template(
+        _LOADBALANCER_TEMPLATE_NAME, {
+            'namespace': namespace,
+            'service_name': service_name,
+            'ports': ports,
+            'selector_key': selector_key,
+            'selector_value': selector_value,
+        })
     content = yaml.safe_load(cont)
     return content
 
@@ -91,25 +81,18 @@ def fill_ingress_template(namespace: str, service_details: List[Tuple[str, int,
                                                                       str]],
                           ingress_name: str, selector_key: str,
                           selector_value: str) -> Dict:
-    template_path = os.path.join(sky.__root_dir__, 'templates',
-                                 _INGRESS_TEMPLATE_NAME)
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(
-            f'Template "{_INGRESS_TEMPLATE_NAME}" does not exist.')
-    with open(template_path, 'r', encoding='utf-8') as fin:
-        template = fin.read()
-    j2_template = jinja2.Template(template)
-    cont = j2_template.render(
-        namespace=namespace,
-        service_names_and_ports=[{
-            'service_name': name,
-            'service_port': port,
-            'path_prefix': path_prefix
-        } for name, port, path_prefix in service_details],
-        ingress_name=ingress_name,
-        selector_key=selector_key,
-        selector_value=selector_value,
-    )
+    cont = common_utils.render_template(
+        _INGRESS_TEMPLATE_NAME, {
+            'namespace': namespace,
+            'service_names_and_ports': [{
+                'service_name': name,
+                'service_port': port,
+                'path_prefix': path_prefix
+            } for name, port, path_prefix in service_details],
+            'ingress_name': ingress_name,
+            'selector_key': selector_key,
+            'selector_value': selector_value,
+        })
     content = yaml.safe_load(cont)
 
     # Return a dictionary containing both specs
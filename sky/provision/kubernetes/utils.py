@@ -8,10 +8,8 @@ import subprocess
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse
 
-import jinja2
 import yaml
 
-import sky
 from sky import exceptions
 from sky import sky_logging
 from sky import skypilot_config
@@ -1252,18 +1250,13 @@ def clean_zombie_ssh_jump_pod(namespace: str, node_id: str):
 
 def fill_ssh_jump_template(ssh_key_secret: str, ssh_jump_image: str,
                            ssh_jump_name: str, service_type: str) -> Dict:
-    template_path = os.path.join(sky.__root_dir__, 'templates',
-                                 'kubernetes-ssh-jump.yml.j2')
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(
-            'Template "kubernetes-ssh-jump.j2" does not exist.')
-    with open(template_path, 'r', encoding='utf-8') as fin:
-        template = fin.read()
-    j2_template = jinja2.Template(template)
-    cont = j2_template.render(name=ssh_jump_name,
-                              image=ssh_jump_image,
-                              secret=ssh_key_secret,
-                              service_type=service_type)
+    cont = common_utils.render_template(
+        'kubernetes-ssh-jump.yml.j2', {
+            'name': ssh_jump_name,
+            'image': ssh_jump_image,
+            'secret': ssh_key_secret,
+            'service_type': service_type,
+        })
     content = yaml.safe_load(cont)
     return content
 
@@ -143,8 +143,7 @@ class ReplicaStatus(enum.Enum):
         ]
 
     def colored_str(self) -> str:
-        color = _REPLICA_STATUS_TO_COLOR[self]
-        return f'{color}{self.value}{colorama.Style.RESET_ALL}'
+        return _REPLICA_STATUS_TO_COLORED_STR[self]
 
 
 _REPLICA_STATUS_TO_COLOR = {
@@ -162,6 +161,10 @@ _REPLICA_STATUS_TO_COLOR = {
     ReplicaStatus.PREEMPTED: colorama.Fore.MAGENTA,
     ReplicaStatus.UNKNOWN: colorama.Fore.RED,
 }
+_REPLICA_STATUS_TO_COLORED_STR = {
+    status: f'{color}{status.value}{colorama.Style.RESET_ALL}'
+    for status, color in _REPLICA_STATUS_TO_COLOR.items()
+}
 
 
 class ServiceStatus(enum.Enum):
@@ -201,8 +204,7 @@ class ServiceStatus(enum.Enum):
         return [cls.CONTROLLER_FAILED, cls.FAILED_CLEANUP, cls.SHUTTING_DOWN]
 
     def colored_str(self) -> str:
-        color = _SERVICE_STATUS_TO_COLOR[self]
-        return f'{color}{self.value}{colorama.Style.RESET_ALL}'
+        return _SERVICE_STATUS_TO_COLORED_STR[self]
 
     @classmethod
     def from_replica_statuses(
@@ -230,6 +232,10 @@ _SERVICE_STATUS_TO_COLOR = {
     ServiceStatus.FAILED_CLEANUP: colorama.Fore.RED,
     ServiceStatus.NO_REPLICA: colorama.Fore.MAGENTA,
 }
+_SERVICE_STATUS_TO_COLORED_STR = {
+    status: f'{color}{status.value}{colorama.Style.RESET_ALL}'
+    for status, color in _SERVICE_STATUS_TO_COLOR.items()
+}
 
 
 def add_service(name: str, controller_job_id: int, policy: str,
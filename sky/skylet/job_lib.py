@@ -132,8 +132,7 @@ class JobStatus(enum.Enum):
         return list(JobStatus).index(self) < list(JobStatus).index(other)
 
     def colored_str(self):
-        color = _JOB_STATUS_TO_COLOR[self]
-        return f'{color}{self.value}{colorama.Style.RESET_ALL}'
+        return _JOB_STATUS_TO_COLORED_STR[self]
 
 
 # Only update status of the jobs after this many seconds of job submission,
@@ -216,6 +215,11 @@ _JOB_STATUS_TO_COLOR = {
     JobStatus.FAILED_SETUP: colorama.Fore.RED,
     JobStatus.CANCELLED: colorama.Fore.YELLOW,
 }
+# Built once, as colored_str() is called for each job in `sky queue`.
+_JOB_STATUS_TO_COLORED_STR = {
+    status: f'{color}{status.value}{colorama.Style.RESET_ALL}'
+    for status, color in _JOB_STATUS_TO_COLOR.items()
+}
 
 _RAY_TO_JOB_STATUS_MAP = {
     # These are intentionally set this way, because:
@@ -2,6 +2,7 @@
 
 This is a remote utility module that provides logging functionality.
 """
+import contextlib
 import copy
 import io
 import multiprocessing.pool
@@ -12,7 +13,8 @@ import sys
 import tempfile
 import textwrap
 import time
-from typing import Dict, Iterator, List, Optional, Tuple, Union
+from typing import (ContextManager, Dict, Iterator, List, Optional, TextIO,
+                    Tuple, Union)
 
 import colorama
 
@@ -64,9 +66,21 @@ def _handle_io_stream(io_stream, out_stream, args: _ProcessingArgs):
     streaming_prefix = args.streaming_prefix if args.streaming_prefix else ''
     line_processor = (log_utils.LineProcessor()
                       if args.line_processor is None else args.line_processor)
+    # Hoist the per-line checks out of the loop, as this is on the hot path
+    # for chatty commands, e.g., `ray up` and user jobs.
+    skip_lines = tuple(args.skip_lines) if args.skip_lines else ()
+    end_streaming_at = args.end_streaming_at
 
     out = []
-    with open(args.log_path, 'a', encoding='utf-8') as fout:
+    # The log file is line-buffered, i.e., flushed on each '\n' or '\r', so
+    # that `sky logs` can follow it, without an explicit flush() per line.
+    # Skip writing to /dev/null altogether.
+    log_file_ctx: ContextManager[Optional[TextIO]]
+    if args.log_path == os.devnull:
+        log_file_ctx = contextlib.nullcontext()
+    else:
+        log_file_ctx = open(args.log_path, 'a', encoding='utf-8', buffering=1)
+    with log_file_ctx as fout:
         with line_processor:
             while True:
                 line = out_io.readline()
@@ -77,13 +91,11 @@ def _handle_io_stream(io_stream, out_stream, args: _ProcessingArgs):
                     # Replace CRLF with LF to avoid ray logging to the same
                     # line due to separating lines with '\n'.
                     line = line[:-2] + '\n'
-                if (args.skip_lines is not None and
-                        any(skip in line for skip in args.skip_lines)):
+                if skip_lines and any(skip in line for skip in skip_lines):
                     continue
-                if args.start_streaming_at in line:
+                if not start_streaming_flag and args.start_streaming_at in line:
                     start_streaming_flag = True
-                if (args.end_streaming_at is not None and
-                        args.end_streaming_at in line):
+                if end_streaming_at is not None and end_streaming_at in line:
                     # Keep executing the loop, only stop streaming.
                     # E.g., this is used for `sky bench` to hide the
                     # redundant messages of `sky launch` while
@@ -95,9 +107,8 @@ def _handle_io_stream(io_stream, out_stream, args: _ProcessingArgs):
                           end='',
                           file=out_stream,
                           flush=True)
-                if args.log_path != '/dev/null':
+                if fout is not None:
                     fout.write(line)
-                    fout.flush()
                 line_processor.process_line(line)
                 out.append(line)
     return ''.join(out)
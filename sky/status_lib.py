@@ -24,8 +24,7 @@ class ClusterStatus(enum.Enum):
     STOPPED = 'STOPPED'
 
     def colored_str(self):
-        color = _STATUS_TO_COLOR[self]
-        return f'{color}{self.value}{colorama.Style.RESET_ALL}'
+        return _STATUS_TO_COLORED_STR[self]
 
 
 _STATUS_TO_COLOR = {
@@ -33,6 +32,12 @@ _STATUS_TO_COLOR = {
     ClusterStatus.UP: colorama.Fore.GREEN,
     ClusterStatus.STOPPED: colorama.Fore.YELLOW,
 }
+# colored_str() is called for each row of `sky status`, so build the
+# strings once.
+_STATUS_TO_COLORED_STR = {
+    status: f'{color}{status.value}{colorama.Style.RESET_ALL}'
+    for status, color in _STATUS_TO_COLOR.items()
+}
 
 
 class StorageStatus(enum.Enum):
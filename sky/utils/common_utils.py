@@ -43,6 +43,18 @@ _PAYLOAD_STR = '<sky-payload>{}</sky-payload>'
 
 _VALID_ENV_VAR_REGEX = '[a-zA-Z_][a-zA-Z0-9_]*'
 
+# Use the libyaml-based loader when PyYAML is built with it, which is much
+# faster than the pure-Python one and loads the same documents.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                              'templates')
+# Compiled template bytecode is persisted here, so that new processes (e.g.,
+# each `sky` CLI invocation) can skip lexing, parsing and compiling templates
+# they have rendered before. Entries are checked against the template source,
+# so a changed template is recompiled.
+_TEMPLATE_BYTECODE_CACHE_DIR = os.path.expanduser('~/.sky/jinja_cache')
+
 logger = sky_logging.init_logger(__name__)
 
 _usage_run_id = None
@@ -302,13 +314,17 @@ def user_and_hostname_hash() -> str:
 
 def read_yaml(path) -> Dict[str, Any]:
     with open(path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     return config
 
 
+def read_yaml_str(yaml_str: str) -> Dict[str, Any]:
+    return yaml.load(yaml_str, Loader=_YAML_SAFE_LOADER)
+
+
 def read_yaml_all(path: str) -> List[Dict[str, Any]]:
     with open(path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load_all(f)
+        config = yaml.load_all(f, Loader=_YAML_SAFE_LOADER)
         configs = list(config)
         if not configs:
             # Empty YAML file.
@@ -321,21 +337,24 @@ def dump_yaml(path, config) -> None:
         f.write(dump_yaml_str(config))
 
 
-def dump_yaml_str(config):
-    # https://github.com/yaml/pyyaml/issues/127
-    class LineBreakDumper(yaml.SafeDumper):
+# https://github.com/yaml/pyyaml/issues/127
+# Overrides the pure-Python emitter, so it cannot be based on the libyaml
+# CSafeDumper.
+class _LineBreakDumper(yaml.SafeDumper):
 
-        def write_line_break(self, data=None):
-            super().write_line_break(data)
-            if len(self.indents) == 1:
-                super().write_line_break()
+    def write_line_break(self, data=None):
+        super().write_line_break(data)
+        if len(self.indents) == 1:
+            super().write_line_break()
 
+
+def dump_yaml_str(config):
     if isinstance(config, list):
         dump_func = yaml.dump_all
     else:
         dump_func = yaml.dump
     return dump_func(config,
-                     Dumper=LineBreakDumper,
+                     Dumper=_LineBreakDumper,
                      sort_keys=False,
                      default_flow_style=False)
 
@@ -634,24 +653,60 @@ def get_cleaned_username(username: str = '') -> str:
     return username
 
 
+@functools.lru_cache(maxsize=1)
+def _get_template_env() -> jinja2.Environment:
+    """Returns the Jinja environment shared by all templates.
+
+    Compiled templates are cached by the environment (keyed by template name),
+    so that rendering the same template multiple times in one process, e.g.,
+    provisioning several clusters, does not re-parse and re-compile the
+    template. The templates are shipped with the package and never change at
+    runtime, so there is no need to check for updates on each load.
+    """
+    bytecode_cache = None
+    try:
+        os.makedirs(_TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(
+            directory=_TEMPLATE_BYTECODE_CACHE_DIR, pattern='%s.cache')
+    except OSError as e:
+        # The cache is only an optimization; fall back to compiling the
+        # templates in each process.
+        logger.debug(f'Jinja bytecode cache disabled: {e}')
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(searchpath=_TEMPLATES_DIR),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        cache_size=-1)
+
+
+def render_template(template_name: str, variables: Dict) -> str:
+    """Renders a Jinja template in sky/templates and returns the content."""
+    template_path = os.path.join(_TEMPLATES_DIR, template_name)
+    if not os.path.exists(template_path):
+        raise FileNotFoundError(f'Template "{template_name}" does not exist.')
+    j2_template = _get_template_env().get_template(template_name)
+    return j2_template.render(**variables)
+
+
 def fill_template(template_name: str, variables: Dict,
                   output_path: str) -> None:
     """Create a file from a Jinja template and return the filename."""
     assert template_name.endswith('.j2'), template_name
-    root_dir = os.path.dirname(os.path.dirname(__file__))
-    template_path = os.path.join(root_dir, 'templates', template_name)
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(f'Template "{template_name}" does not exist.')
-    with open(template_path, 'r', encoding='utf-8') as fin:
-        template = fin.read()
+    content = render_template(template_name, variables)
     output_path = os.path.abspath(os.path.expanduser(output_path))
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
     # Write out yaml config.
-    j2_template = jinja2.Template(template)
-    content = j2_template.render(**variables)
-    with open(output_path, 'w', encoding='utf-8') as fout:
-        fout.write(content)
+    # Encode once and write the bytes directly to the fd, bypassing the
+    # TextIOWrapper/BufferedWriter layers. Same permissions as open(..., 'w').
+    content_view = memoryview(content.encode('utf-8'))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while content_view:
+            written = os.write(fd, content_view)
+            content_view = content_view[written:]
+    finally:
+        os.close(fd)
 
 
 def deprecated_function(
@@ -59,8 +59,14 @@ def run_in_parallel(func: Callable, args: Iterable[Any]) -> List[Any]:
       A list of the return values of the function func, in the same order as the
       arguments.
     """
+    args = list(args)
+    if not args:
+        return []
+    # Do not spawn more threads than the number of arguments, e.g., a
+    # single-node cluster should not pay for starting a full thread pool.
+    processes = min(get_parallel_threads(), len(args))
     # Reference: https://stackoverflow.com/questions/25790279/python-multiprocessing-early-termination # pylint: disable=line-too-long
-    with pool.ThreadPool(processes=get_parallel_threads()) as p:
+    with pool.ThreadPool(processes=processes) as p:
         # Run the function in parallel on the arguments, keeping the order.
         return list(p.imap(func, args))
 
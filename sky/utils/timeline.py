@@ -17,6 +17,12 @@ from sky.utils import common_utils
 
 _events = []
 
+# The timeline is only saved when this env var is set (see the end of this
+# module), so we skip recording the events otherwise, to avoid the overhead and
+# the unbounded growth of `_events` for long-running processes, e.g., the
+# controllers.
+_TIMELINE_FILE_PATH = os.environ.get('SKYPILOT_TIMELINE_FILE_PATH')
+
 
 class Event:
     """Record an event.
@@ -43,6 +49,8 @@ class Event:
             self._event['args'] = {'message': self._message}
 
     def begin(self):
+        if not _TIMELINE_FILE_PATH:
+            return
         event_begin = self._event.copy()
         event_begin.update({
             'ph': 'B',
@@ -53,6 +61,8 @@ class Event:
         _events.append(event_begin)
 
     def end(self):
+        if not _TIMELINE_FILE_PATH:
+            return
         event_end = self._event.copy()
         event_end.update({
             'ph': 'E',
@@ -126,8 +136,8 @@ def _save_timeline(file_path: str):
     }
     os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(json_output, f)
+        json.dump(json_output, f, separators=(',', ':'))
 
 
-if os.environ.get('SKYPILOT_TIMELINE_FILE_PATH'):
-    atexit.register(_save_timeline, os.environ['SKYPILOT_TIMELINE_FILE_PATH'])
+if _TIMELINE_FILE_PATH:
+    atexit.register(_save_timeline, _TIMELINE_FILE_PATH)
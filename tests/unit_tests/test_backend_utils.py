@@ -1,4 +1,7 @@
 import pathlib
+import subprocess
+import threading
+import time
 from typing import Dict
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -6,6 +9,7 @@ from unittest.mock import patch
 import pytest
 
 from sky import clouds
+from sky import exceptions
 from sky import skypilot_config
 from sky.backends import backend_utils
 from sky.resources import Resources
@@ -121,3 +125,167 @@ def test_write_cluster_config_w_remote_identity(mock_fill_template,
             "config template incorrect")
     assert (mock_fill_template.call_args[0][1].items() >=
             expected_subset.items(), "config fill values incorrect")
+
+
+@pytest.fixture
+def ray_autoscaler_cluster():
+    """Makes get_node_ips() query the IPs with the `ray` CLI."""
+    cloud = Mock(PROVISIONER_VERSION=clouds.ProvisionerVersion.RAY_AUTOSCALER)
+    with patch('sky.utils.common_utils.read_yaml',
+               return_value={'provider': {}}), \
+         patch('sky.backends.backend_utils.cluster_yaml_utils.'
+               'get_provider_name', return_value='fake'), \
+         patch.object(backend_utils.cloud_registry.CLOUD_REGISTRY,
+                      'from_str', return_value=cloud), \
+         patch('sky.backends.backend_utils.check_network_connection'):
+        yield
+
+
+def _worker_ips_output(ips):
+    return Mock(stdout='\n'.join(ips).encode())
+
+
+@pytest.mark.usefixtures('ray_autoscaler_cluster')
+@patch('sky.utils.subprocess_utils.run')
+@patch('sky.backends.backend_utils._query_head_ip_with_retries',
+       return_value='1.1.1.1')
+def test_get_node_ips_queries_head_and_workers(mock_head_ip, mock_run) -> None:
+    mock_run.return_value = _worker_ips_output(['2.2.2.2', '3.3.3.3'])
+    ips = backend_utils.get_node_ips('/tmp/fake.yaml', expected_num_nodes=3)
+    assert ips == ['1.1.1.1', '2.2.2.2', '3.3.3.3']
+    mock_head_ip.assert_called_once()
+    mock_run.assert_called_once()
+    assert 'ray get-worker-ips' in mock_run.call_args[0][0]
+
+
+@pytest.mark.usefixtures('ray_autoscaler_cluster')
+@patch('sky.backends.backend_utils._query_worker_ips_in_background')
+@patch('sky.utils.subprocess_utils.run')
+@patch('sky.backends.backend_utils._query_head_ip_with_retries',
+       return_value='1.1.1.1')
+def test_get_node_ips_single_node_skips_worker_query(mock_head_ip, mock_run,
+                                                     mock_background) -> None:
+    ips = backend_utils.get_node_ips('/tmp/fake.yaml', expected_num_nodes=1)
+    assert ips == ['1.1.1.1']
+    mock_head_ip.assert_called_once()
+    mock_run.assert_not_called()
+    mock_background.assert_not_called()
+
+
+@pytest.mark.usefixtures('ray_autoscaler_cluster')
+@pytest.mark.parametrize('head_error', [
+    exceptions.FetchClusterInfoError(
+        exceptions.FetchClusterInfoError.Reason.HEAD),
+    KeyboardInterrupt(),
+])
+@patch('sky.utils.subprocess_utils.run')
+@patch('sky.backends.backend_utils._query_head_ip_with_retries')
+def test_get_node_ips_head_failure_stops_worker_query(mock_head_ip, mock_run,
+                                                      head_error) -> None:
+    run_started = threading.Event()
+    release_run = threading.Event()
+
+    def slow_run(*args, **kwargs):
+        del args, kwargs  # unused
+        run_started.set()
+        release_run.wait(timeout=30)
+        raise subprocess.CalledProcessError(1, 'ray get-worker-ips')
+
+    def failing_head_query(*args, **kwargs):
+        del args, kwargs  # unused
+        # Fail while `ray get-worker-ips` is in flight.
+        assert run_started.wait(timeout=30)
+        raise head_error
+
+    mock_run.side_effect = slow_run
+    mock_head_ip.side_effect = failing_head_query
+    start = time.time()
+    try:
+        with pytest.raises(type(head_error)) as e:
+            backend_utils.get_node_ips('/tmp/fake.yaml',
+                                       expected_num_nodes=2,
+                                       worker_ip_max_attempts=100)
+        assert e.value is head_error
+        # The head error is raised without waiting for the in-flight worker
+        # query, which only returns once released (or after 30 seconds).
+        assert time.time() - start < 10
+    finally:
+        release_run.set()
+    # The worker query does not retry after the head query failed.
+    time.sleep(0.5)
+    assert mock_run.call_count == 1
+
+
+@pytest.mark.usefixtures('ray_autoscaler_cluster')
+@pytest.mark.parametrize('run_kwargs', [
+    {
+        'side_effect': subprocess.CalledProcessError(1, 'ray get-worker-ips')
+    },
+    {
+        'return_value': _worker_ips_output(['2.2.2.2'])
+    },
+])
+@patch('sky.backends.backend_utils._query_head_ip_with_retries',
+       return_value='1.1.1.1')
+def test_get_node_ips_worker_failure(mock_head_ip, run_kwargs) -> None:
+    del mock_head_ip  # unused
+    with patch('sky.utils.subprocess_utils.run', **run_kwargs):
+        with pytest.raises(exceptions.FetchClusterInfoError) as e:
+            backend_utils.get_node_ips('/tmp/fake.yaml', expected_num_nodes=3)
+    assert e.value.reason == exceptions.FetchClusterInfoError.Reason.WORKER
+
+
+def test_make_cloud_store_download_command_single_download() -> None:
+    command = backend_utils.FileMountHelper.make_cloud_store_download_command(
+        install_commands=['install-cli'],
+        download_commands=['mkdir -p ~/a && sync-a'])
+    assert command == 'install-cli && mkdir -p ~/a && sync-a'
+
+
+def test_make_cloud_store_download_command_installs_once(tmp_path) -> None:
+    log = tmp_path / 'log'
+    install = f'echo install >> {log}'
+    command = backend_utils.FileMountHelper.make_cloud_store_download_command(
+        # Both mounts use the same CLI, e.g., two GCS buckets.
+        install_commands=[install, install],
+        download_commands=[
+            f'echo download-a >> {log}', f'echo download-b >> {log}'
+        ])
+    # The install runs once, before the downloads are started in background.
+    assert command.count(install) == 1
+    assert command.startswith(f'{install} && {{ pids=(); rc=0; ')
+    assert '( echo download-a' in command and '( echo download-b' in command
+
+    subprocess.run(['bash', '-c', command], check=True)
+    lines = log.read_text().splitlines()
+    assert lines[0] == 'install'
+    assert sorted(lines) == ['download-a', 'download-b', 'install']
+
+
+@pytest.mark.parametrize('install_command, download_commands', [
+    ('false', ['true', 'true']),
+    ('true', ['true', 'false']),
+    ('true', ['false', 'sleep 0.2']),
+])
+def test_make_cloud_store_download_command_fails(install_command,
+                                                 download_commands) -> None:
+    command = backend_utils.FileMountHelper.make_cloud_store_download_command(
+        install_commands=[install_command],
+        download_commands=download_commands)
+    proc = subprocess.run(['bash', '-c', command], check=False)
+    assert proc.returncode != 0
+
+
+@pytest.mark.parametrize('path, other, expected', [
+    ('~/.sky/file_mounts/data', '~/.sky/file_mounts/data', True),
+    # A file mount nested under a directory mount, in either order.
+    ('~/.sky/file_mounts/data', '~/.sky/file_mounts/data/cfg.yaml', True),
+    ('~/.sky/file_mounts/data/sub', '~/.sky/file_mounts/data', True),
+    ('~/.sky/file_mounts/data/', '~/.sky/file_mounts/data/sub', True),
+    ('~/.sky/file_mounts/data', '~/.sky/file_mounts/data2', False),
+    ('~/.sky/file_mounts/data/a', '~/.sky/file_mounts/data/b', False),
+    ('/tmp/data', '~/.sky/file_mounts/tmp/data', False),
+])
+def test_file_mount_paths_overlap(path, other, expected) -> None:
+    assert backend_utils.FileMountHelper.paths_overlap(path,
+                                                       other) is expected
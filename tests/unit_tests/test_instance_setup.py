@@ -0,0 +1,16 @@
+import subprocess
+
+import pytest
+
+from sky.provision import instance_setup
+from sky.utils import common_utils
+
+
+@pytest.mark.parametrize('ray_port', ['6379', '6380', '12345'])
+def test_echo_ray_port_payload_command(ray_port) -> None:
+    command = instance_setup._echo_ray_port_payload_command()
+    output = subprocess.run(['bash', '-c', f'RAY_PORT={ray_port}; {command}'],
+                            stdout=subprocess.PIPE,
+                            check=True,
+                            encoding='utf-8').stdout
+    assert common_utils.decode_payload(output) == {'ray_port': int(ray_port)}